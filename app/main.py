@@ -10,38 +10,186 @@
 
 
 import logging
-from fastapi import FastAPI, HTTPException, status
+import os
+from email.message import Message
+from typing import Any, Optional
+
+import msgspec
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.utils import (
+    get_openapi,
+    validation_error_definition,
+    validation_error_response_definition,
+)
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter, ValidationError
+
+# Configure logging before importing app.service, which creates the chess
+# service (and logs its setup) at import time. Per-request messages are
+# logged at DEBUG; set LOG_LEVEL=WARNING in production to keep only problems
+log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+valid_log_level = log_level in logging.getLevelNamesMapping()
+logging.basicConfig(level=log_level if valid_log_level else logging.INFO)
+logger = logging.getLogger(__name__)
+if not valid_log_level:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", log_level)
 
-from app.models import (
+from app.models import (  # noqa: E402
     MoveRequest,
     RemovePieceRequest,
     BoardStateResponse,
     MoveResponse,
     RemoveResponse,
-    PieceInfo
 )
-from app.service import get_chess_service
+from app.service import CHESS_SERVICE  # noqa: E402
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response encoded with msgspec (Structs, dicts and lists)."""
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
+
+
+# Response models are msgspec Structs, which FastAPI cannot document on its
+# own; generate their JSON schemas once and register them as components.
+(
+    _BOARD_STATE_SCHEMA,
+    _MOVE_SCHEMA,
+    _REMOVE_SCHEMA,
+), _RESPONSE_COMPONENTS = msgspec.json.schema_components(
+    (BoardStateResponse, MoveResponse, RemoveResponse),
+    ref_template="#/components/schemas/{name}",
+)
+
+
+def _json_response(schema: dict) -> dict:
+    """Build the OpenAPI `responses` entry for a msgspec response model."""
+    return {200: {"content": {"application/json": {"schema": schema}}}}
+
+
+# Request bodies are validated straight from the raw bytes by pydantic-core,
+# skipping the intermediate json.loads of FastAPI's body parameters.
+_MOVE_ADAPTER = TypeAdapter(MoveRequest)
+_REMOVE_ADAPTER = TypeAdapter(RemovePieceRequest)
+
+_REQUEST_COMPONENTS = {
+    model.__name__: model.model_json_schema(ref_template="#/components/schemas/{model}")
+    for model in (MoveRequest, RemovePieceRequest)
+}
+
+
+# The 422 response FastAPI documents for body parameters
+_VALIDATION_ERROR_COMPONENTS = {
+    "ValidationError": validation_error_definition,
+    "HTTPValidationError": validation_error_response_definition,
+}
+_VALIDATION_ERROR_RESPONSE = {
+    422: {
+        "description": "Validation Error",
+        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/HTTPValidationError"}}},
+    }
+}
+
+
+def _json_request_body(model: type) -> dict:
+    """Build the OpenAPI `requestBody` entry for a request model."""
+    schema = {"$ref": f"#/components/schemas/{model.__name__}"}
+    return {"requestBody": {"content": {"application/json": {"schema": schema}}, "required": True}}
+
+
+def _is_json(content_type: Optional[str]) -> bool:
+    """Check for a JSON content type (application/json or application/*+json)."""
+    if not content_type:
+        return False
+    message = Message()
+    message["content-type"] = content_type
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+async def _parse_body(request: Request, adapter: TypeAdapter) -> Any:
+    """Validate the request body, reporting errors like FastAPI's body parameters."""
+    body = await request.body()
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    # Like FastAPI, only JSON bodies are decoded; anything else cannot be a request object
+    if not _is_json(request.headers.get("content-type")):
+        raise RequestValidationError(
+            [{
+                "type": "model_attributes_type",
+                "loc": ("body",),
+                "msg": "Input should be a valid dictionary or object to extract fields from",
+                "input": body,
+            }]
+        )
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        # validate_json reports pydantic-core's own error types: JSON that is not
+        # an object gives model_type and malformed JSON gives json_invalid
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+async def parse_move_request(request: Request) -> MoveRequest:
+    """Parse and validate the body of a move request."""
+    return await _parse_body(request, _MOVE_ADAPTER)
+
+
+async def parse_remove_request(request: Request) -> RemovePieceRequest:
+    """Parse and validate the body of a remove request."""
+    return await _parse_body(request, _REMOVE_ADAPTER)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
 
 # Create FastAPI application
 app = FastAPI(
     title="Resty Chess API",
     description="A RESTful API to manage a chess board",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=MsgspecJSONResponse,
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add CORS middleware only for the origins listed in CORS_ALLOW_ORIGINS
+# (comma separated); same-origin deployments skip it entirely
+cors_allow_origins = [
+    origin.strip() for origin in os.environ.get("CORS_ALLOW_ORIGINS", "").split(",") if origin.strip()
+]
+if cors_allow_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_allow_origins,
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["Content-Type"],
+    )
+
+
+def custom_openapi() -> dict:
+    """Generate the OpenAPI schema, including the msgspec and raw-body models."""
+    if app.openapi_schema:
+        return app.openapi_schema
+    openapi_schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        description=app.description,
+        routes=app.routes,
+    )
+    openapi_schema.setdefault("components", {}).setdefault("schemas", {}).update(
+        {**_VALIDATION_ERROR_COMPONENTS, **_REQUEST_COMPONENTS, **_RESPONSE_COMPONENTS}
+    )
+    app.openapi_schema = openapi_schema
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
 
 
 @app.get("/", tags=["Root"])
@@ -50,21 +198,29 @@ async def root():
     return {"message": "Resty Chess API is running"}
 
 
-@app.get("/v1/board", response_model=BoardStateResponse, tags=["Chess"])
-async def get_board():
+@app.get(
+    "/v1/board",
+    responses=_json_response(_BOARD_STATE_SCHEMA),
+    tags=["Chess"],
+)
+def get_board():
     """
     Get the current state of the chess board.
     
     Returns:
         Current board state with all pieces and their positions
     """
-    logger.info("Getting board state")
-    chess_service = get_chess_service()
-    return chess_service.get_board_state()
+    logger.debug("Getting board state")
+    return Response(content=CHESS_SERVICE.get_board_json(), media_type="application/json")
 
 
-@app.post("/v1/move", response_model=MoveResponse, tags=["Chess"])
-async def move_piece(move_request: MoveRequest):
+@app.post(
+    "/v1/move",
+    responses={**_json_response(_MOVE_SCHEMA), **_VALIDATION_ERROR_RESPONSE},
+    openapi_extra=_json_request_body(MoveRequest),
+    tags=["Chess"],
+)
+def move_piece(move_request: MoveRequest = Depends(parse_move_request)):
     """
     Move a chess piece from one square to another.
     
@@ -77,16 +233,15 @@ async def move_piece(move_request: MoveRequest):
     Raises:
         HTTPException: If the move is invalid
     """
-    logger.info(f"Move request: {move_request.from_square} to {move_request.to_square}")
-    chess_service = get_chess_service()
+    logger.debug("Move request: %s to %s", move_request.from_square, move_request.to_square)
     
     try:
-        board_state, moved_piece, captured_piece = chess_service.move_piece(
+        board_state, moved_piece, captured_piece = CHESS_SERVICE.move_piece(
             move_request.from_square, 
             move_request.to_square
         )
         
-        return MoveResponse(
+        return MsgspecJSONResponse(MoveResponse(
             board=board_state["board"],
             from_square=move_request.from_square,
             to_square=move_request.to_square,
@@ -94,18 +249,23 @@ async def move_piece(move_request: MoveRequest):
             captured_piece=captured_piece,
             fen=board_state["fen"],
             turn=board_state["turn"]
-        )
+        ))
         
     except ValueError as e:
-        logger.error(f"Move error: {str(e)}")
+        logger.error("Move error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
 
-@app.post("/v1/remove", response_model=RemoveResponse, tags=["Chess"])
-async def remove_piece(remove_request: RemovePieceRequest):
+@app.post(
+    "/v1/remove",
+    responses={**_json_response(_REMOVE_SCHEMA), **_VALIDATION_ERROR_RESPONSE},
+    openapi_extra=_json_request_body(RemovePieceRequest),
+    tags=["Chess"],
+)
+def remove_piece(remove_request: RemovePieceRequest = Depends(parse_remove_request)):
     """
     Remove a chess piece from the specified square.
     
@@ -118,22 +278,21 @@ async def remove_piece(remove_request: RemovePieceRequest):
     Raises:
         HTTPException: If the removal is invalid (e.g., empty square)
     """
-    logger.info(f"Remove piece request at square: {remove_request.square}")
-    chess_service = get_chess_service()
+    logger.debug("Remove piece request at square: %s", remove_request.square)
     
     try:
-        board_state, removed_piece = chess_service.remove_piece(remove_request.square)
+        board_state, removed_piece = CHESS_SERVICE.remove_piece(remove_request.square)
         
-        return RemoveResponse(
+        return MsgspecJSONResponse(RemoveResponse(
             board=board_state["board"],
             removed_square=remove_request.square,
             removed_piece=removed_piece,
             fen=board_state["fen"],
             turn=board_state["turn"]
-        )
+        ))
         
     except ValueError as e:
-        logger.error(f"Remove error: {str(e)}")
+        logger.error("Remove error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -143,4 +302,15 @@ async def remove_piece(remove_request: RemovePieceRequest):
 if __name__ == "__main__":
     # This block is executed when running the file directly
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # uvloop and httptools come with uvicorn[standard]; the board lives in
+    # process memory, so a single worker keeps one consistent board state
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=False,
+        workers=1,
+        access_log=False,
+    )
\ No newline at end of file
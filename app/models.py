@@ -1,32 +1,64 @@
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, Field, field_validator
 from typing import Dict, Optional, List
 
 
+# All squares in algebraic notation; validating against a set is a single
+# hash lookup instead of a regex match per field
+_SQUARES = frozenset(f"{file}{rank}" for file in "abcdefgh" for rank in "12345678")
+
+# Still advertised in the OpenAPI schema, but not used for validation
+_SQUARE_PATTERN = "^[a-h][1-8]$"
+
+
+# Squares are checked in per-field validators rather than one model_validator
+# so that an invalid square is reported against its own field, as the regex
+# pattern was (e.g. loc ['body', 'to_square'])
+def _check_square(square: str) -> str:
+    """Ensure a square is on the board (e.g. 'e2')."""
+    if square not in _SQUARES:
+        raise ValueError(f"Invalid square: {square}")
+    return square
+
+
 class MoveRequest(BaseModel):
     """Model for move piece request."""
-    from_square: str = Field(..., pattern="^[a-h][1-8]$", description="Source square in algebraic notation (e.g. 'e2')")
-    to_square: str = Field(..., pattern="^[a-h][1-8]$", description="Target square in algebraic notation (e.g. 'e4')")
+    from_square: str = Field(..., json_schema_extra={"pattern": _SQUARE_PATTERN}, description="Source square in algebraic notation (e.g. 'e2')")
+    to_square: str = Field(..., json_schema_extra={"pattern": _SQUARE_PATTERN}, description="Target square in algebraic notation (e.g. 'e4')")
+
+    @field_validator("from_square", "to_square")
+    @classmethod
+    def check_square(cls, square: str) -> str:
+        return _check_square(square)
 
 
 class RemovePieceRequest(BaseModel):
     """Model for remove piece request."""
-    square: str = Field(..., pattern="^[a-h][1-8]$", description="Square containing the piece to remove")
+    square: str = Field(..., json_schema_extra={"pattern": _SQUARE_PATTERN}, description="Square containing the piece to remove")
+
+    @field_validator("square")
+    @classmethod
+    def check_square(cls, square: str) -> str:
+        return _check_square(square)
+
 
+# Response models are msgspec Structs: they are built on every request and
+# encoded straight to JSON bytes, skipping Pydantic validation/serialization.
 
-class PieceInfo(BaseModel):
+class PieceInfo(msgspec.Struct, frozen=True):
     """Model for piece information."""
     piece_type: str  # pawn, knight, bishop, rook, queen, king
     color: str       # white or black
 
 
-class BoardStateResponse(BaseModel):
+class BoardStateResponse(msgspec.Struct):
     """Response model for board state."""
     board: Dict[str, Optional[PieceInfo]]  # Key is square, value is piece
     fen: str  # Forsyth-Edwards Notation representation
     turn: str  # Current player's turn (white or black)
 
 
-class MoveResponse(BaseModel):
+class MoveResponse(msgspec.Struct, kw_only=True):
     """Response model after a move operation."""
     board: Dict[str, Optional[PieceInfo]]
     from_square: str
@@ -37,7 +69,7 @@ class MoveResponse(BaseModel):
     turn: str
 
 
-class RemoveResponse(BaseModel):
+class RemoveResponse(msgspec.Struct):
     """Response model after a remove operation."""
     board: Dict[str, Optional[PieceInfo]]
     removed_square: str
@@ -48,4 +80,4 @@ class RemoveResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Error response model."""
-    detail: str
\ No newline at end of file
+    detail: str
@@ -1,12 +1,11 @@
 import chess
 import logging
-from functools import lru_cache
-from typing import Dict, Optional, Tuple
+import msgspec
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from app.models import PieceInfo
+from app.models import BoardStateResponse, PieceInfo
+from app.utils import ReadWriteLock
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Piece type mapping: python-chess piece symbols to human-readable names
@@ -25,109 +24,253 @@ COLOR_NAMES = {
     chess.BLACK: "black"
 }
 
+# One shared PieceInfo per (piece type, color); PieceInfo is immutable
+PIECE_INFO_CACHE: Dict[Tuple[int, bool], PieceInfo] = {
+    (piece_type, color): PieceInfo(piece_type=PIECE_TYPE_NAMES[piece_type], color=COLOR_NAMES[color])
+    for piece_type in PIECE_TYPE_NAMES
+    for color in COLOR_NAMES
+}
+
+# Square names indexed by python-chess square number (a1, b1, ..., h8)
+SQUARE_NAMES: Tuple[str, ...] = tuple(chess.square_name(square) for square in chess.SQUARES)
+
+# Square name to board index lookup
+_SQUARE_INDEX = {name: index for index, name in enumerate(SQUARE_NAMES)}
+
+# The board is stored as 64 bytes, one per square: 0 for an empty square,
+# otherwise piece_type | color << 3 (black pieces 1-6, white pieces 9-14)
+EMPTY = 0
+_COLOR_SHIFT = 3
+_PIECE_TYPE_MASK = (1 << _COLOR_SHIFT) - 1
+
+
+def encode_piece(piece_type: int, color: bool) -> int:
+    """Encode a python-chess piece type and color as a board byte."""
+    return piece_type | (color << _COLOR_SHIFT)
+
+
+# PieceInfo for each board byte, None for an empty square
+_CODE_TO_PIECE_INFO: Tuple[Optional[PieceInfo], ...] = tuple(
+    PIECE_INFO_CACHE.get((code & _PIECE_TYPE_MASK, bool(code >> _COLOR_SHIFT)))
+    for code in range(encode_piece(chess.KING, chess.WHITE) + 1)
+)
+
+_WHITE_KING = encode_piece(chess.KING, chess.WHITE)
+_WHITE_ROOK = encode_piece(chess.ROOK, chess.WHITE)
+_BLACK_KING = encode_piece(chess.KING, chess.BLACK)
+_BLACK_ROOK = encode_piece(chess.ROOK, chess.BLACK)
+
+# FEN symbol for each board byte (uppercase for white)
+_PIECE_SYMBOLS = {
+    encode_piece(piece_type, color): chess.piece_symbol(piece_type).upper() if color else chess.piece_symbol(piece_type)
+    for piece_type in PIECE_TYPE_NAMES
+    for color in COLOR_NAMES
+}
+
+_BACK_RANK = (chess.ROOK, chess.KNIGHT, chess.BISHOP, chess.QUEEN, chess.KING, chess.BISHOP, chess.KNIGHT, chess.ROOK)
+
+# Standard starting position, rank 1 to rank 8
+_START_POSITION = bytes(
+    [encode_piece(piece_type, chess.WHITE) for piece_type in _BACK_RANK]
+    + [encode_piece(chess.PAWN, chess.WHITE)] * 8
+    + [EMPTY] * 32
+    + [encode_piece(chess.PAWN, chess.BLACK)] * 8
+    + [encode_piece(piece_type, chess.BLACK) for piece_type in _BACK_RANK]
+)
+
+
+# bytes.translate table from board bytes to FEN symbols, empty squares as "1"
+_FEN_TABLE = bytes(
+    ord(_PIECE_SYMBOLS[code]) if code in _PIECE_SYMBOLS else ord("1")
+    for code in range(256)
+)
+
+# Runs of empty squares, longest first, and the digit that replaces each
+_FEN_EMPTY_RUNS = tuple((b"1" * count, str(count).encode()) for count in range(8, 1, -1))
+
+
+def _fen_placement(squares: bytearray) -> str:
+    """Build the piece placement field of a FEN string from the board bytes."""
+    symbols = squares.translate(_FEN_TABLE)
+    placement = b"/".join(symbols[rank_start:rank_start + 8] for rank_start in range(56, -8, -8))
+    for run, digit in _FEN_EMPTY_RUNS:
+        placement = placement.replace(run, digit)
+    return placement.decode()
+
+
+def _parse_square(square: str) -> int:
+    """
+    Convert a square in algebraic notation to its board index.
+    
+    Raises:
+        ValueError: If the square name is not on the board
+    """
+    try:
+        return _SQUARE_INDEX[square]
+    except KeyError:
+        raise ValueError(f"Invalid square: {square}") from None
+
 
 class ChessBoardService:
     """Service to manage chess board state."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize a new chess board with standard setup."""
-        self._board = chess.Board()
+        self._squares: bytearray = bytearray(_START_POSITION)
+        self._turn: bool = chess.WHITE
+        # Board state and its JSON encoding, rebuilt lazily after a mutation
+        self._cached_state: Optional[Dict[str, Any]] = None
+        self._cached_json: Optional[bytes] = None
+        # Readers share the lock; moves and removals hold it exclusively
+        self._lock = ReadWriteLock()
+        # Encode the starting position up front so the first GET is served from cache
+        self.get_board_json()
         logger.info("Chess board initialized with standard setup")
 
-    def get_board_state(self) -> Dict:
+    def _invalidate_cache(self) -> None:
+        """Drop the cached board state after the board has been mutated."""
+        self._cached_state = None
+        self._cached_json = None
+
+    def _piece_info(self, square: int) -> Optional[PieceInfo]:
+        """Get the piece info for the piece on a square, or None if it is empty."""
+        return _CODE_TO_PIECE_INFO[self._squares[square]]
+
+    def _castling_fen(self) -> str:
         """
-        Get the current state of the chess board.
+        Get the FEN castling field.
         
-        Returns:
-            Dict containing the board state with pieces and their positions
+        Moves are not played through chess rules, so castling rights follow the
+        position alone: a side may castle on a wing while its king and that
+        rook are on their starting squares.
         """
-        board_state = {}
+        squares = self._squares
+        castling = ""
+        if squares[chess.E1] == _WHITE_KING:
+            if squares[chess.H1] == _WHITE_ROOK:
+                castling += "K"
+            if squares[chess.A1] == _WHITE_ROOK:
+                castling += "Q"
+        if squares[chess.E8] == _BLACK_KING:
+            if squares[chess.H8] == _BLACK_ROOK:
+                castling += "k"
+            if squares[chess.A8] == _BLACK_ROOK:
+                castling += "q"
+        return castling or "-"
+
+    def _fen(self) -> str:
+        """Build the Forsyth-Edwards Notation string for the current position."""
+        turn = "w" if self._turn == chess.WHITE else "b"
+        # No moves are pushed, so there is never an en passant square and
+        # the move counters stay at their initial values
+        return f"{_fen_placement(self._squares)} {turn} {self._castling_fen()} - 0 1"
+
+    def _build_board_state(self) -> Dict[str, Any]:
+        """Get the board state, rebuilding it if needed. Callers hold the lock."""
+        if self._cached_state is not None:
+            return self._cached_state
         
-        # Iterate through all squares on the board
-        for square in chess.SQUARES:
-            square_name = chess.square_name(square)
-            piece = self._board.piece_at(square)
-            
-            if piece:
-                board_state[square_name] = PieceInfo(
-                    piece_type=PIECE_TYPE_NAMES[piece.piece_type],
-                    color=COLOR_NAMES[piece.color]
-                )
-            else:
-                board_state[square_name] = None
+        # Map every board byte to its PieceInfo in a single comprehension;
+        # plain indexing avoids a method call per square and mypyc compiles
+        # it to a native loop
+        piece_infos = _CODE_TO_PIECE_INFO
+        # Typed as Iterable[int]: mypyc crashes iterating a bytearray-typed attribute
+        codes: Iterable[int] = self._squares
+        board_state: Dict[str, Optional[PieceInfo]] = {
+            square_name: piece_infos[code] for square_name, code in zip(SQUARE_NAMES, codes)
+        }
         
-        return {
+        self._cached_state = {
             "board": board_state,
-            "fen": self._board.fen(),
-            "turn": COLOR_NAMES[self._board.turn]
+            "fen": self._fen(),
+            "turn": COLOR_NAMES[self._turn]
         }
+        return self._cached_state
 
-    def move_piece(self, from_square: str, to_square: str) -> Tuple[Dict, Optional[PieceInfo]]:
+    def get_board_state(self) -> Dict[str, Any]:
+        """
+        Get the current state of the chess board.
+        
+        The state is cached until the next move or removal; a cached state is
+        returned without taking the lock.
+        
+        Returns:
+            Dict containing the board state with pieces and their positions
+        """
+        board_state = self._cached_state
+        if board_state is not None:
+            return board_state
+        with self._lock.read():
+            return self._build_board_state()
+
+    def get_board_json(self) -> bytes:
+        """
+        Get the current state of the chess board encoded as JSON.
+        
+        Returns:
+            JSON document matching BoardStateResponse, cached until the next mutation
+        """
+        board_json = self._cached_json
+        if board_json is not None:
+            return board_json
+        with self._lock.read():
+            if self._cached_json is None:
+                self._cached_json = msgspec.json.encode(BoardStateResponse(**self._build_board_state()))
+            return self._cached_json
+
+    def move_piece(self, from_square: str, to_square: str) -> Tuple[Dict[str, Any], PieceInfo, Optional[PieceInfo]]:
         """
         Move a piece from one square to another.
         
+        Chess rules are not enforced: any piece can be moved to any square,
+        capturing whatever is there.
+        
         Args:
             from_square: Source square in algebraic notation (e.g. 'e2')
             to_square: Target square in algebraic notation (e.g. 'e4')
             
         Returns:
-            Tuple containing board state and captured piece info (if any)
+            Tuple containing board state, moved piece info and captured piece info (if any)
             
         Raises:
-            ValueError: If move is invalid or out of board boundaries
+            ValueError: If a square is invalid or the source square is empty
         """
         try:
-            # Convert algebraic notation to square indexes
-            from_sq = chess.parse_square(from_square)
-            to_sq = chess.parse_square(to_square)
-            
-            # Check if source square has a piece
-            piece = self._board.piece_at(from_sq)
-            if not piece:
-                raise ValueError(f"No piece found at {from_square}")
-            
-            # Store piece information before move
-            moved_piece = PieceInfo(
-                piece_type=PIECE_TYPE_NAMES[piece.piece_type],
-                color=COLOR_NAMES[piece.color]
-            )
-            
-            # Check if there's a piece at the target square (capture)
-            captured_piece = None
-            target_piece = self._board.piece_at(to_sq)
-            if target_piece:
-                captured_piece = PieceInfo(
-                    piece_type=PIECE_TYPE_NAMES[target_piece.piece_type],
-                    color=COLOR_NAMES[target_piece.color]
-                )
-            
-            # Create and execute move
-            move = chess.Move(from_sq, to_sq)
-            
-            # We're not validating chess rules, just ensuring move is within board
-            if move not in self._board.pseudo_legal_moves:
-                # Check if the move is only invalid because of chess rules
-                if from_sq > 63 or to_sq > 63:
-                    raise ValueError("Move is outside the board boundaries")
+            with self._lock.write():
+                # Convert algebraic notation to square indexes
+                from_sq = _parse_square(from_square)
+                to_sq = _parse_square(to_square)
                 
-            # Make the move (only checking board boundaries, not chess rules)
-            self._board.set_piece_at(to_sq, piece)
-            self._board.remove_piece_at(from_sq)
-            
-            # Toggle turn (white to black or black to white)
-            self._board.turn = not self._board.turn
-            
-            logger.info(f"Moved {moved_piece.color} {moved_piece.piece_type} from {from_square} to {to_square}")
-            if captured_piece:
-                logger.info(f"Captured {captured_piece.color} {captured_piece.piece_type} at {to_square}")
+                squares = self._squares
+                moved_code = squares[from_sq]
+                
+                # Check if source square has a piece
+                moved_piece = _CODE_TO_PIECE_INFO[moved_code]
+                if not moved_piece:
+                    raise ValueError(f"No piece found at {from_square}")
+                
+                # Check if there's a piece at the target square (capture)
+                captured_piece = _CODE_TO_PIECE_INFO[squares[to_sq]]
+                
+                # Make the move: two byte stores, no allocation
+                squares[to_sq] = moved_code
+                squares[from_sq] = EMPTY
+                
+                # Toggle turn (white to black or black to white)
+                self._turn = not self._turn
+                self._invalidate_cache()
+                
+                logger.debug("Moved %s %s from %s to %s", moved_piece.color, moved_piece.piece_type, from_square, to_square)
+                if captured_piece:
+                    logger.debug("Captured %s %s at %s", captured_piece.color, captured_piece.piece_type, to_square)
+                
+                return self._build_board_state(), moved_piece, captured_piece
                 
-            return self.get_board_state(), moved_piece, captured_piece
-            
         except ValueError as e:
-            logger.error(f"Invalid move: {str(e)}")
+            logger.error("Invalid move: %s", e)
             raise
     
-    def remove_piece(self, square: str) -> Tuple[Dict, Optional[PieceInfo]]:
+    def remove_piece(self, square: str) -> Tuple[Dict[str, Any], PieceInfo]:
         """
         Remove a piece from the specified square.
         
@@ -135,42 +278,43 @@ class ChessBoardService:
             square: Square in algebraic notation (e.g. 'e4')
             
         Returns:
-            Tuple containing board state and removed piece info (if any)
+            Tuple containing board state and removed piece info
             
         Raises:
             ValueError: If square is invalid or empty
         """
         try:
-            sq = chess.parse_square(square)
-            
-            # Check if there's a piece at the square
-            piece = self._board.piece_at(sq)
-            if not piece:
-                raise ValueError(f"No piece found at {square}")
-            
-            # Store piece information before removal
-            removed_piece = PieceInfo(
-                piece_type=PIECE_TYPE_NAMES[piece.piece_type],
-                color=COLOR_NAMES[piece.color]
-            )
-            
-            # Remove the piece
-            self._board.remove_piece_at(sq)
-            
-            logger.info(f"Removed {removed_piece.color} {removed_piece.piece_type} from {square}")
-            return self.get_board_state(), removed_piece
-            
+            with self._lock.write():
+                sq = _parse_square(square)
+                
+                # Check if there's a piece at the square
+                removed_piece = self._piece_info(sq)
+                if not removed_piece:
+                    raise ValueError(f"No piece found at {square}")
+                
+                # Remove the piece
+                self._squares[sq] = EMPTY
+                self._invalidate_cache()
+                
+                logger.debug("Removed %s %s from %s", removed_piece.color, removed_piece.piece_type, square)
+                return self._build_board_state(), removed_piece
+                
         except ValueError as e:
-            logger.error(f"Invalid remove operation: {str(e)}")
+            logger.error("Invalid remove operation: %s", e)
             raise
 
 
-@lru_cache(maxsize=1)
+# The chess service singleton, created eagerly at import
+CHESS_SERVICE = ChessBoardService()
+
+
 def get_chess_service() -> ChessBoardService:
     """
     Get the chess service singleton instance.
     
+    Kept for backwards compatibility; prefer importing CHESS_SERVICE.
+    
     Returns:
         ChessBoardService instance
     """
-    return ChessBoardService()
\ No newline at end of file
+    return CHESS_SERVICE
@@ -0,0 +1,6 @@
+from uvicorn_worker import UvicornWorker
+
+
+class ChessUvicornWorker(UvicornWorker):
+    """Gunicorn worker running uvicorn with uvloop, httptools and no access log."""
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "access_log": False}
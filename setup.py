@@ -0,0 +1,25 @@
+"""
+Build script for the optional compiled board service.
+
+    RESTY_CHESS_MYPYC=1 python setup.py build_ext --inplace
+
+compiles app/service.py and app/utils.py with mypyc (pip install mypy) into
+extension modules placed next to the sources. Python imports the extensions
+when present and falls back to the pure-Python modules otherwise, so the app
+runs either way. Without RESTY_CHESS_MYPYC=1 nothing is compiled, and
+installing the package needs neither mypy nor a C compiler.
+"""
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("RESTY_CHESS_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["app/service.py", "app/utils.py"])
+
+setup(
+    name="resty-chess",
+    packages=["app"],
+    ext_modules=ext_modules,
+)
@@ -27,6 +27,9 @@ def test_get_board():
     assert data["board"]["e1"]["color"] == "white"
     assert data["board"]["d8"]["piece_type"] == "queen"
     assert data["board"]["d8"]["color"] == "black"
+    
+    assert data["fen"] == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    assert data["turn"] == "white"
 
 
 def test_move_piece():
@@ -78,4 +81,91 @@ def test_invalid_move():
         json={"from_square": "e3", "to_square": "e4"}
     )
     assert response.status_code == 400
-    assert "No piece found" in response.json()["detail"]
\ No newline at end of file
+    assert "No piece found" in response.json()["detail"]
+
+
+def test_get_board_reflects_move():
+    """Test that the board state is refreshed after a mutation."""
+    client.get("/v1/board")
+    client.post("/v1/move", json={"from_square": "d7", "to_square": "d5"})
+    
+    response = client.get("/v1/board")
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert data["board"]["d7"] is None
+    assert data["board"]["d5"]["piece_type"] == "pawn"
+    assert data["board"]["d5"]["color"] == "black"
+
+
+def test_move_outside_board():
+    """Test that squares outside the board are rejected at request validation."""
+    response = client.post(
+        "/v1/move",
+        json={"from_square": "e2", "to_square": "e9"}
+    )
+    assert response.status_code == 422
+    
+    errors = response.json()["detail"]
+    assert len(errors) == 1
+    assert errors[0]["loc"] == ["body", "to_square"]
+
+
+def test_move_requires_json_content_type():
+    """Test that a JSON body sent with a non-JSON content type is rejected."""
+    response = client.post(
+        "/v1/move",
+        content=b'{"from_square": "g1", "to_square": "f3"}',
+        headers={"Content-Type": "text/plain"}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body"]
+    
+    # The knight has not moved
+    data = client.get("/v1/board").json()
+    assert data["board"]["g1"]["piece_type"] == "knight"
+    assert data["board"]["f3"] is None
+
+
+def test_move_requires_body():
+    """Test that an empty body is reported as a missing body."""
+    response = client.post(
+        "/v1/move",
+        content=b"",
+        headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 422
+    
+    errors = response.json()["detail"]
+    assert errors == [{"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}]
+
+
+def test_move_requires_json_object():
+    """Test that a JSON body that is not an object is rejected."""
+    response = client.post("/v1/move", json=["g1", "f3"])
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body"]
+
+
+def test_move_rejects_text_json_content_type():
+    """Test that only application/ JSON content types are decoded."""
+    for content_type in ("text/json", "text/vnd.chess+json"):
+        response = client.post(
+            "/v1/move",
+            content=b'{"from_square": "g1", "to_square": "f3"}',
+            headers={"Content-Type": content_type}
+        )
+        assert response.status_code == 422
+    
+    data = client.get("/v1/board").json()
+    assert data["board"]["g1"]["piece_type"] == "knight"
+
+
+def test_openapi_documents_validation_errors():
+    """Test that the body endpoints still document their 422 response."""
+    schema = client.get("/openapi.json").json()
+    
+    for path in ("/v1/move", "/v1/remove"):
+        assert "422" in schema["paths"][path]["post"]["responses"]
+    assert "HTTPValidationError" in schema["components"]["schemas"]
+    assert "ValidationError" in schema["components"]["schemas"]
@@ -0,0 +1,39 @@
+from app.service import ChessBoardService
+
+
+def test_fen_after_move():
+    """Test that the FEN reflects a move and hands the turn to black."""
+    service = ChessBoardService()
+    board_state, _, _ = service.move_piece("e2", "e4")
+    
+    assert board_state["fen"] == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+    assert board_state["turn"] == "black"
+
+
+def test_fen_castling_rights():
+    """Test that castling rights are dropped once a king or rook leaves its home square."""
+    service = ChessBoardService()
+    
+    board_state, _, _ = service.move_piece("h1", "h3")
+    assert board_state["fen"].split()[2] == "Qkq"
+    
+    board_state, _ = service.remove_piece("a8")
+    assert board_state["fen"].split()[2] == "Qk"
+    
+    board_state, _, _ = service.move_piece("e8", "e6")
+    assert board_state["fen"].split()[2] == "Q"
+    
+    board_state, _ = service.remove_piece("e1")
+    assert board_state["fen"].split()[2] == "-"
+
+
+def test_fen_collapses_empty_squares():
+    """Test that runs of empty squares inside and at the end of a rank are counted."""
+    service = ChessBoardService()
+    for square in ("b2", "d2", "e2", "g7", "h7"):
+        board_state, _ = service.remove_piece(square)
+    
+    ranks = board_state["fen"].split()[0].split("/")
+    assert ranks[1] == "pppppp2"
+    assert ranks[6] == "P1P2PPP"
+    assert ranks[3] == "8"
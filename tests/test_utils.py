@@ -0,0 +1,84 @@
+import threading
+
+from app.utils import ReadWriteLock
+
+# Long enough for a blocked thread to have acquired the lock if it could
+WAIT = 0.2
+
+
+def _in_thread(target):
+    """Start target in a daemon thread and return the thread."""
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_readers_share_the_lock():
+    """Test that a reader is not blocked by another reader."""
+    lock = ReadWriteLock()
+    acquired = threading.Event()
+    
+    def reader():
+        with lock.read():
+            acquired.set()
+    
+    with lock.read():
+        _in_thread(reader)
+        assert acquired.wait(WAIT)
+
+
+def test_writer_excludes_readers():
+    """Test that a writer waits for readers, and readers wait for the writer."""
+    lock = ReadWriteLock()
+    writing = threading.Event()
+    release_writer = threading.Event()
+    reading = threading.Event()
+    
+    def writer():
+        with lock.write():
+            writing.set()
+            release_writer.wait()
+    
+    def reader():
+        with lock.read():
+            reading.set()
+    
+    with lock.read():
+        writer_thread = _in_thread(writer)
+        assert not writing.wait(WAIT)
+    assert writing.wait(WAIT)
+    
+    _in_thread(reader)
+    assert not reading.wait(WAIT)
+    release_writer.set()
+    writer_thread.join(WAIT)
+    assert reading.wait(WAIT)
+
+
+def test_queued_writer_blocks_new_readers():
+    """Test that a waiting writer goes ahead of readers arriving after it."""
+    lock = ReadWriteLock()
+    order = []
+    writer_queued = threading.Event()
+    
+    def writer():
+        writer_queued.set()
+        with lock.write():
+            order.append("writer")
+    
+    def reader():
+        with lock.read():
+            order.append("reader")
+    
+    with lock.read():
+        writer_thread = _in_thread(writer)
+        writer_queued.wait(WAIT)
+        # Give the writer time to start waiting on the lock
+        writer_thread.join(WAIT)
+        reader_thread = _in_thread(reader)
+        reader_thread.join(WAIT)
+        assert order == []
+    
+    writer_thread.join(WAIT)
+    reader_thread.join(WAIT)
+    assert order == ["writer", "reader"]